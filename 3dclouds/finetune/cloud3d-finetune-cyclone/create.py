@@ -16,7 +16,7 @@ from pathlib import Path
 
 import tacotoolbox
 from tacotoolbox import create
-from dataset.config import BUILD_CONFIG, PARQUET_CONFIG
+from dataset.config import BUILD_CONFIG, parquet_config
 from dataset.taco import create_taco
 from dataset.metadata import load_contexts
 
@@ -213,7 +213,7 @@ def main():
             split_size=split_size,
             group_by=group_by,
             consolidate=consolidate,
-            **PARQUET_CONFIG
+            **parquet_config(len(taco.tortilla.samples))
         )
     except Exception as e:
         print(f"\nERROR: Failed to create TACO: {e}")
@@ -0,0 +1,50 @@
+"""
+Per-sample helpers on the level0 hot path - Cloud3D Cyclones
+
+Small, allocation-light functions called once per sample by metadata.py and
+levels/level0.py. Kept together (and free of third-party imports) so workers
+pay nothing extra to import them.
+"""
+
+import calendar
+import struct
+
+# Little-endian WKB for a 2D Point: byte order 1, geometry type 1, then x, y
+# as float64 (same 21 bytes as shapely's Point.wkb)
+_WKB_POINT_HEAD = b"\x01\x01\x00\x00\x00"
+_PACK_XY = struct.Struct("<dd").pack
+
+
+def detect_satellite(folder_name: str) -> str:
+    """Detect satellite type from folder name (G16_* or YYYYMMDD_*)."""
+    if folder_name.startswith("G16_"):
+        return "GOES-16"
+    elif len(folder_name) >= 9 and folder_name[8] == "_" and folder_name[:8].isdigit():
+        return "Himawari"
+    else:
+        raise ValueError(f"Unknown satellite pattern: {folder_name}")
+
+
+def parse_ts_us(date_str: str) -> int:
+    """
+    Parse a global.json timestamp into int64 microseconds since Unix epoch (UTC).
+
+    Layout is fixed ("YYYY-MM-DD HH:MM:SS" with optional ".ffffff"), so the
+    fields are sliced directly instead of going through strptime.
+    """
+    seconds = calendar.timegm((
+        int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+        int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+    ))
+    micros = int(date_str[20:26].ljust(6, "0")) if len(date_str) > 20 else 0
+    return seconds * 1_000_000 + micros
+
+
+def normalize_lon(lon: float) -> float:
+    """Wrap longitude to [-180, 180] (IBTrACS uses [0, 360] for some basins)."""
+    return lon - 360 if lon > 180 else lon
+
+
+def point_wkb(lon: float, lat: float) -> bytes:
+    """Serialize a 2D point to little-endian WKB without going through GEOS."""
+    return _WKB_POINT_HEAD + _PACK_XY(lon, lat)
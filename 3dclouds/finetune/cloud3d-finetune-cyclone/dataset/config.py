@@ -7,12 +7,24 @@ radar profiles for tropical cyclones identified via IBTrACS best track archive.
 DO NOT EDIT the COLLECTION dictionary at the bottom.
 """
 
+from packaging.version import Version
+
+import tacoreader
 import tacotoolbox
-if tacotoolbox.__version__ < "0.22.0":
-    raise ImportError(
-        f"tacotoolbox >= 0.22.0 required (found {tacotoolbox.__version__}). "
-        "Run: pip install -U tacotoolbox"
-    )
+
+
+def _check_version(module, minimum: str) -> None:
+    """Raise ImportError if an installed package is older than minimum (PEP 440 comparison)."""
+    if Version(module.__version__) < Version(minimum):
+        raise ImportError(
+            f"{module.__name__} >= {minimum} required (found {module.__version__}). "
+            f"Run: pip install -U {module.__name__}"
+        )
+
+
+# Checked once, when the dataset package first imports its config
+_check_version(tacotoolbox, "0.22.0")
+_check_version(tacoreader, "2.0.0")
 
 from tacotoolbox.datamodel.taco import Provider, Curator, Publication, Publications
 
@@ -93,11 +105,13 @@ COLLECTION_PUBLICATIONS = Publications(
 
 # DataFrame backend for testing/debugging output
 DATAFRAME_BACKEND = "pandas"  # "pyarrow", "polars", "pandas"
+tacoreader.use(DATAFRAME_BACKEND)
 
 # Parallel processing
 WORKERS = 32
 LEVEL0_PARALLEL = True
 LEVEL0_SAMPLE_LIMIT = None  # None = all samples, set number for debugging
+METADATA_WORKERS = 64       # Threads for the IO-bound directory scan in load_contexts
 
 # Output settings
 OUTPUT_PATH = "/data/databases/CLOUD_3D/pretraining/tacos/finetune/cyclones/cyclones.tacozip"
@@ -118,12 +132,27 @@ THEME_COLOR = "#e74c3c"  # Red for cyclones/hurricanes
 DATASET_EXAMPLE_PATH = "https://data.source.coop/taco/3dclouds/cyclones/"
 
 # Parquet configuration (passed to create() as **kwargs)
-PARQUET_ROW_GROUP_SIZE = 122880
+PARQUET_ROW_GROUP_SIZE = 122880     # used as-is when PARQUET_AUTO_ROW_GROUP_SIZE = False
+PARQUET_AUTO_ROW_GROUP_SIZE = True   # size row groups from the sample count at build time
+PARQUET_MIN_ROW_GROUP_SIZE = 50_000  # floor used when sizing row groups automatically
 PARQUET_COMPRESSION = "zstd"
-PARQUET_COMPRESSION_LEVEL = 22
-PARQUET_USE_DICTIONARY = False
+PARQUET_COMPRESSION_LEVEL = 9        # ~same ratio as 22 at a fraction of the write time
+PARQUET_USE_DICTIONARY = True        # low-cardinality ids (storm_id, satellite, ...)
 PARQUET_WRITE_STATISTICS = False
-PARQUET_DATA_PAGE_SIZE = 256 * 1024
+PARQUET_DATA_PAGE_SIZE = 256 * 1024  # bytes per data page inside a column chunk
+
+
+def parquet_config(n_samples: int) -> dict:
+    """
+    PARQUET_CONFIG with row_group_size resolved for a build of n_samples.
+
+    With PARQUET_AUTO_ROW_GROUP_SIZE the whole metadata table fits in one
+    row group (at least PARQUET_MIN_ROW_GROUP_SIZE rows), so remote readers
+    fetch each column chunk with a single range request.
+    """
+    if not PARQUET_AUTO_ROW_GROUP_SIZE:
+        return dict(PARQUET_CONFIG)
+    return {**PARQUET_CONFIG, "row_group_size": max(n_samples, PARQUET_MIN_ROW_GROUP_SIZE)}
 
 
 # INTERNAL: Auto-generated dictionaries (DO NOT EDIT)
@@ -4,17 +4,55 @@ Dataset Extensions - Cloud3D Cyclones
 Two extensions:
 1. Cloud3DMetadata - Base satellite/CloudSat metadata (same as finetune)
 2. Cloud3DCycloneMetadata - IBTrACS cyclone-specific metadata
+
+Both also implement _batch_compute(instances), which builds one Arrow table
+for many samples. level0 uses it through SampleColumns to add these columns
+once per Tortilla instead of one single-row table per sample.
+
+from_attrs validates the first record built in each process (the canary)
+and uses model_construct() for the rest, skipping pydantic validation; the
+required keys and value types are still checked by hand for every record,
+so a malformed *_global.json fails inside build_sample for its own sample.
 """
 
-import json
 import re
 from pathlib import Path
-from typing import Literal
+from typing import ClassVar, Literal
 
+import orjson
 import pyarrow as pa
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from tacotoolbox.sample.datamodel import SampleExtension
+from tacotoolbox.tortilla.datamodel import TortillaExtension
+
+from dataset._fastpath import normalize_lon
+
+
+def read_global_attrs(global_json: str | Path) -> dict:
+    """
+    Read and parse the "attributes" block of a *_global.json file ({} if absent).
+
+    The single reader for *_global.json in this recipe (metadata.py uses it too).
+    """
+    with open(global_json, "rb") as f:
+        return orjson.loads(f.read()).get("attributes", {})
+
+
+def load_global_attrs(directory: Path) -> dict:
+    """Read and parse the "attributes" block of the *_global.json in a sample directory."""
+    json_files = list(directory.glob("*_global.json"))
+    if not json_files:
+        raise FileNotFoundError(f"No *_global.json found in {directory}")
+    
+    return read_global_attrs(json_files[0])
+
+
+def _as_float(value, name: str) -> float:
+    """Return a numeric *_global.json value as float, raising TypeError for anything else."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+    return float(value)
 
 
 class Cloud3DMetadata(SampleExtension):
@@ -41,6 +79,8 @@ class Cloud3DMetadata(SampleExtension):
         description="Whether 2B-FLXHR radiative flux/heating rate data is available"
     )
 
+    _canary_validated: ClassVar[bool] = False
+
     def get_schema(self) -> pa.Schema:
         return pa.schema([
             pa.field("cloud3d:satellite", pa.string()),
@@ -58,39 +98,54 @@ class Cloud3DMetadata(SampleExtension):
         }
 
     def _compute(self, sample) -> pa.Table:
-        data = {
-            "cloud3d:satellite": [self.satellite],
-            "cloud3d:geostationary_id": [self.geostationary_id],
-            "cloud3d:cloudsat_id": [self.cloudsat_id],
-            "cloud3d:has_flxhr": [self.has_flxhr],
-        }
-        return pa.Table.from_pydict(data, schema=self.get_schema())
+        return self._batch_compute([self])
 
     @classmethod
-    def from_directory(
+    def _batch_compute(cls, instances: list["Cloud3DMetadata"]) -> pa.Table:
+        """Build one table with a row per instance."""
+        schema = instances[0].get_schema()
+        return pa.Table.from_arrays([
+            pa.array([m.satellite for m in instances], type=pa.string()),
+            pa.array([m.geostationary_id for m in instances], type=pa.string()),
+            pa.array([m.cloudsat_id for m in instances], type=pa.string()),
+            pa.array([m.has_flxhr for m in instances], type=pa.bool_()),
+        ], schema=schema)
+
+    @classmethod
+    def from_attrs(
         cls,
-        directory: Path,
+        attrs: dict,
+        directory_name: str,
         satellite: Literal["GOES", "Himawari", "MSG"],
     ) -> "Cloud3DMetadata":
-        """Create from sample directory containing *_global.json."""
-        json_files = list(directory.glob("*_global.json"))
-        if not json_files:
-            raise FileNotFoundError(f"No *_global.json found in {directory}")
-        
-        with open(json_files[0], "r") as f:
-            metadata = json.load(f)
-        
-        attrs = metadata["attributes"]
+        """Create from the already-parsed "attributes" of a *_global.json."""
+        # Missing keys raise KeyError and non-path values TypeError here, in
+        # build_sample, even when model_construct() skips validation below
         geostationary_id = Path(attrs["satellite_filename"]).stem
         cloudsat_id = Path(attrs["cloudsat_filename"]).stem
-        has_flxhr = "no_flxhr" not in directory.name
+        has_flxhr = "no_flxhr" not in directory_name
         
-        return cls(
+        data = dict(
             satellite=satellite,
             geostationary_id=geostationary_id,
             cloudsat_id=cloudsat_id,
             has_flxhr=has_flxhr,
         )
+        if cls._canary_validated:
+            return cls.model_construct(**data)
+        
+        instance = cls(**data)
+        cls._canary_validated = True
+        return instance
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path,
+        satellite: Literal["GOES", "Himawari", "MSG"],
+    ) -> "Cloud3DMetadata":
+        """Create from sample directory containing *_global.json."""
+        return cls.from_attrs(load_global_attrs(directory), directory.name, satellite)
 
 
 class Cloud3DCycloneMetadata(SampleExtension):
@@ -121,6 +176,8 @@ class Cloud3DCycloneMetadata(SampleExtension):
         description="Temporal offset between geostationary and CloudSat observations (seconds)"
     )
 
+    _canary_validated: ClassVar[bool] = False
+
     def get_schema(self) -> pa.Schema:
         return pa.schema([
             pa.field("cyclone:storm_id", pa.string()),
@@ -140,36 +197,84 @@ class Cloud3DCycloneMetadata(SampleExtension):
         }
 
     def _compute(self, sample) -> pa.Table:
-        data = {
-            "cyclone:storm_id": [self.storm_id],
-            "cyclone:center_lat": [self.center_lat],
-            "cyclone:center_lon": [self.center_lon],
-            "cyclone:dist_km": [self.dist_km],
-            "cyclone:delta_t_seconds": [self.delta_t_seconds],
-        }
-        return pa.Table.from_pydict(data, schema=self.get_schema())
+        return self._batch_compute([self])
 
     @classmethod
-    def from_directory(cls, directory: Path) -> "Cloud3DCycloneMetadata":
-        """Create from sample directory containing *_global.json with IBTrACS data."""
-        json_files = list(directory.glob("*_global.json"))
-        if not json_files:
-            raise FileNotFoundError(f"No *_global.json found in {directory}")
-        
-        with open(json_files[0], "r") as f:
-            metadata = json.load(f)
-        
-        attrs = metadata["attributes"]
+    def _batch_compute(cls, instances: list["Cloud3DCycloneMetadata"]) -> pa.Table:
+        """Build one table with a row per instance."""
+        schema = instances[0].get_schema()
+        return pa.Table.from_arrays([
+            pa.array([m.storm_id for m in instances], type=pa.string()),
+            pa.array([m.center_lat for m in instances], type=pa.float64()),
+            pa.array([m.center_lon for m in instances], type=pa.float64()),
+            pa.array([m.dist_km for m in instances], type=pa.float64()),
+            pa.array([m.delta_t_seconds for m in instances], type=pa.float64()),
+        ], schema=schema)
+
+    @classmethod
+    def from_attrs(cls, attrs: dict) -> "Cloud3DCycloneMetadata":
+        """
+        Create from the already-parsed "attributes" of a *_global.json with IBTrACS data.
+
+        Longitude is normalized to [-180, 180] (IBTrACS uses [0, 360] for some
+        basins) and the time offset is stored as an absolute value, so the
+        model fields match the exported cyclone:* columns.
+
+        Required keys and value types are checked here, in build_sample (so
+        failures carry the sample id), even when model_construct() skips
+        validation below.
+        """
+        storm_id = attrs["SID"]
+        if not isinstance(storm_id, str):
+            raise TypeError(f"SID must be a string, got {type(storm_id).__name__}")
         
-        # Normalize longitude to [-180, 180] (IBTrACS uses [0, 360] for some basins)
-        lon = attrs["LON"]
-        if lon > 180:
-            lon = lon - 360
+        data = dict(
+            storm_id=storm_id,
+            center_lat=_as_float(attrs["LAT"], "LAT"),
+            center_lon=normalize_lon(_as_float(attrs["LON"], "LON")),
+            dist_km=_as_float(attrs["dist_km"], "dist_km"),
+            delta_t_seconds=abs(_as_float(attrs.get("abs_delta_t_s", attrs.get("delta_t", 0)), "delta_t")),
+        )
+        if cls._canary_validated:
+            return cls.model_construct(**data)
         
+        instance = cls(**data)
+        cls._canary_validated = True
+        return instance
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> "Cloud3DCycloneMetadata":
+        """Create from sample directory containing *_global.json with IBTrACS data."""
+        return cls.from_attrs(load_global_attrs(directory))
+
+
+class SampleColumns(TortillaExtension):
+    """
+    Per-sample extension columns computed in bulk for a whole Tortilla.
+
+    Wraps the table returned by a SampleExtension's _batch_compute so it can
+    be attached with tortilla.extend_with(). Rows must follow the order of
+    tortilla.samples.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    table: pa.Table
+    descriptions: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def from_instances(cls, instances: list[SampleExtension]) -> "SampleColumns":
+        """Batch-compute one SampleExtension type over all samples."""
         return cls(
-            storm_id=attrs["SID"],
-            center_lat=attrs["LAT"],
-            center_lon=lon,
-            dist_km=attrs["dist_km"],
-            delta_t_seconds=abs(attrs.get("abs_delta_t_s", attrs.get("delta_t", 0))),
-        )
\ No newline at end of file
+            table=type(instances[0])._batch_compute(instances),
+            descriptions=instances[0].get_field_descriptions(),
+        )
+
+    def get_schema(self) -> pa.Schema:
+        return self.table.schema
+
+    def get_field_descriptions(self) -> dict[str, str]:
+        return self.descriptions
+
+    def _compute(self, tortilla) -> pa.Table:
+        return self.table
@@ -11,18 +11,25 @@ Extensions applied:
     - STAC: spatial/temporal metadata from geo_patch.tif
     - Cloud3DMetadata: satellite and CloudSat identifiers
     - Cloud3DCycloneMetadata: IBTrACS cyclone metadata
+
+The two Cloud3D extensions are collected per sample and attached in bulk
+(one Arrow table per extension type) once all samples are built. Their
+cloud3d:* / cyclone:* columns therefore live on the root Tortilla's
+metadata table, not on the individual Sample objects.
 """
 
-from datetime import datetime
+import io
 from pathlib import Path
 
-from osgeo import gdal
+import rasterio as rio
+import tifffile
 from tacotoolbox.datamodel import Sample, Tortilla
 from tacotoolbox.sample.extensions.stac import STAC
 
+from dataset._fastpath import normalize_lon, parse_ts_us, point_wkb
 from dataset.levels import level1
-from dataset.metadata import load_contexts
-from dataset.extensions import Cloud3DMetadata, Cloud3DCycloneMetadata
+from dataset.metadata import WorkerCtx, load_contexts, to_worker_contexts
+from dataset.extensions import Cloud3DMetadata, Cloud3DCycloneMetadata, SampleColumns, read_global_attrs
 
 
 # Tortilla parameters
@@ -30,92 +37,161 @@ PAD_TO = None
 STRICT_SCHEMA = True
 
 
-def parse_timestamp(date_str: str) -> datetime:
-    """Parse timestamp from global.json format (with or without milliseconds)."""
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S.%f")
-    except ValueError:
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+# PROJ strings for each geostationary satellite (built once, shared by all samples)
+# GOES: lon_0=-75, sweep=x
+_CRS_GOES = (
+    "+proj=geos +h=35786023 +a=6378137 +b=6356752.31414 "
+    "+f=0.00335281066474748 +lat_0=0 +lon_0=-75 +sweep=x +no_defs"
+)
+# Himawari: lon_0=140.7, sweep=y
+_CRS_HIMAWARI = (
+    "+proj=geos +h=35786023 +a=6378137 +b=6356752.31414 "
+    "+f=0.00335281066474748 +lat_0=0 +lon_0=140.7 +sweep=y +no_defs"
+)
 
 
 def get_geostationary_crs(satellite_type: str) -> str:
     """Return the correct PROJ string for each geostationary satellite."""
-    if satellite_type == "GOES-16":
-        # GOES: lon_0=-75, sweep=x
-        return (
-            "+proj=geos +h=35786023 +a=6378137 +b=6356752.31414 "
-            "+f=0.00335281066474748 +lat_0=0 +lon_0=-75 +sweep=x +no_defs"
-        )
-    else:
-        # Himawari: lon_0=140.7, sweep=y
-        return (
-            "+proj=geos +h=35786023 +a=6378137 +b=6356752.31414 "
-            "+f=0.00335281066474748 +lat_0=0 +lon_0=140.7 +sweep=y +no_defs"
-        )
+    return _CRS_GOES if satellite_type == "GOES-16" else _CRS_HIMAWARI
+
+
+# Bytes read from the start of each COG; its IFDs live before the pixel data
+COG_HEADER_BYTES = 65536
+
+
+def _read_cog_header(path: Path, n: int = COG_HEADER_BYTES) -> bytes:
+    """Read the leading bytes of a COG in a single sequential read."""
+    with path.open("rb") as f:
+        return f.read(n)
+
+
+# GTRasterTypeGeoKey and its PixelIsArea value (GeoTIFF spec); the fast
+# path below only handles PixelIsArea rasters
+GT_RASTER_TYPE_GEOKEY = 1025
+RASTER_PIXEL_IS_AREA = 1
+
+
+def _raster_type(geokey_directory: tuple[int, ...]) -> int:
+    """Return GTRasterTypeGeoKey from a GeoKeyDirectoryTag value (PixelIsArea if absent)."""
+    n_keys = geokey_directory[3]
+    for k in range(4, 4 + 4 * n_keys, 4):
+        if geokey_directory[k] == GT_RASTER_TYPE_GEOKEY:
+            return geokey_directory[k + 3]
+    return RASTER_PIXEL_IS_AREA
+
+
+def _parse_cog_header(path: Path) -> tuple[tuple[int, int, int], tuple[float, ...]] | None:
+    """
+    Tensor shape and GDAL geotransform from the first IFD, or None if the
+    header bytes cannot answer.
+
+    Only handles north-up PixelIsArea rasters georeferenced with
+    ModelTiepointTag + ModelPixelScaleTag whose IFD fits in the prefix.
+    """
+    try:
+        with tifffile.TiffFile(io.BytesIO(_read_cog_header(path))) as tf:
+            page = tf.pages[0]
+            tags = page.tags
+            if "ModelPixelScaleTag" not in tags or "ModelTiepointTag" not in tags:
+                return None
+            geokeys = tags.get("GeoKeyDirectoryTag")
+            if geokeys is None or _raster_type(geokeys.value) != RASTER_PIXEL_IS_AREA:
+                return None
+            tensor_shape = (page.samplesperpixel, page.imagelength, page.imagewidth)
+            scale_x, scale_y = tags["ModelPixelScaleTag"].value[:2]
+            i, j, _, x, y, _ = tags["ModelTiepointTag"].value[:6]
+    except Exception:
+        # Not a COG, or IFD/tag data beyond the prefix (truncated buffer)
+        return None
+    
+    geotransform = (x - i * scale_x, scale_x, 0.0, y + j * scale_y, 0.0, -scale_y)
+    return tensor_shape, geotransform
+
 
+def read_geotiff_header(path: Path) -> tuple[tuple[int, int, int], tuple[float, ...]]:
+    """
+    Read tensor shape and GDAL geotransform of a GeoTIFF.
 
-def build_sample(ctx: dict) -> Sample:
-    """Build a FOLDER sample containing level1 tortilla with all extensions."""
-    import json
-    from shapely.geometry import Point
+    Tries the header-only parse first (no GDAL dataset/driver setup, no
+    seeks into raster data) and falls back to rasterio for anything it
+    does not handle (non-COG layout, ModelTransformationTag, PixelIsPoint).
+    """
+    header = _parse_cog_header(path)
+    if header is not None:
+        return header
     
-    folder = Path(ctx["path"].decode() if isinstance(ctx["path"], bytes) else ctx["path"])
+    with rio.open(path) as src:
+        return (src.count, src.height, src.width), src.transform.to_gdal()
+
+
+def build_sample(ctx: WorkerCtx) -> tuple[Sample, Cloud3DMetadata, Cloud3DCycloneMetadata]:
+    """
+    Build a FOLDER sample containing level1 tortilla with STAC applied.
+
+    The Cloud3D extensions are returned alongside the sample; build() adds
+    them to the root Tortilla in bulk.
+    """
+    folder = Path(ctx.path)
     
     # Build child tortilla
     child_tortilla = level1.build(ctx)
     
     # Create FOLDER sample
-    sample = Sample(id=ctx["id"], path=child_tortilla)
+    sample = Sample(id=ctx.id, path=child_tortilla)
     
-    # Read global.json for cyclone center (use as patch centroid approximation)
-    json_files = list(folder.glob("*_global.json"))
-    attrs = {}
-    if json_files:
-        with open(json_files[0], "r") as f:
-            attrs = json.load(f).get("attributes", {})
+    # Read global.json once: cyclone center (patch centroid approximation)
+    # and the attributes shared by both Cloud3D extensions below
+    # (path located by load_contexts, so no directory listing here)
+    if ctx.global_json is None:
+        raise FileNotFoundError(f"No *_global.json found in {folder}")
+    attrs = read_global_attrs(ctx.global_json)
     
     # STAC extension (read from geo_patch.tif)
     geo_patch_path = folder / "geo_patch.tif"
-    ds = gdal.Open(str(geo_patch_path))
+    tensor_shape, geotransform = read_geotiff_header(geo_patch_path)
     
     # Parse timestamp (STAC expects int64 microseconds since Unix epoch)
     ts_micro = None
-    if ctx.get("start"):
-        ts = parse_timestamp(ctx["start"])
-        ts_micro = int(ts.timestamp() * 1_000_000)
+    if attrs.get("start"):
+        ts_micro = parse_ts_us(attrs["start"])
     
     # Use cyclone center as centroid (WKB format)
     # Normalize longitude to [-180, 180] (IBTrACS uses [0, 360] for some basins)
     centroid_wkb = None
     if "LAT" in attrs and "LON" in attrs:
-        lon = attrs["LON"]
-        lat = attrs["LAT"]
-        if lon > 180:
-            lon = lon - 360
-        centroid = Point(lon, lat)
-        centroid_wkb = centroid.wkb
+        centroid_wkb = point_wkb(normalize_lon(attrs["LON"]), attrs["LAT"])
     
     stac = STAC(
-        crs=get_geostationary_crs(ctx["satellite_type"]),
-        tensor_shape=(ds.RasterCount, ds.RasterYSize, ds.RasterXSize),
-        geotransform=ds.GetGeoTransform(),
+        crs=get_geostationary_crs(ctx.satellite_type),
+        tensor_shape=tensor_shape,
+        geotransform=geotransform,
         time_start=ts_micro,
         centroid=centroid_wkb,
     )
-    ds = None  # Close dataset
     
     sample.extend_with(stac)
     
     # Cloud3DMetadata extension
-    satellite = "GOES" if ctx["satellite_type"] == "GOES-16" else "Himawari"
-    cloud3d_meta = Cloud3DMetadata.from_directory(folder, satellite=satellite)
-    sample.extend_with(cloud3d_meta)
+    satellite = "GOES" if ctx.satellite_type == "GOES-16" else "Himawari"
+    cloud3d_meta = Cloud3DMetadata.from_attrs(attrs, folder.name, satellite=satellite)
     
     # Cloud3DCycloneMetadata extension
-    cyclone_meta = Cloud3DCycloneMetadata.from_directory(folder)
-    sample.extend_with(cyclone_meta)
+    cyclone_meta = Cloud3DCycloneMetadata.from_attrs(attrs)
     
-    return sample
+    return sample, cloud3d_meta, cyclone_meta
+
+
+class SampleBuildError(RuntimeError):
+    """build_sample failure tagged with the id of the context that caused it."""
+
+
+def _build_sample_tagged(ctx: WorkerCtx) -> tuple[Sample, Cloud3DMetadata, Cloud3DCycloneMetadata]:
+    """Run build_sample, re-raising any failure with the sample id in the message."""
+    try:
+        return build_sample(ctx)
+    except Exception as e:
+        # Only the message survives pickling back from a pool worker
+        raise SampleBuildError(f"Error processing {ctx.id}: {type(e).__name__}: {e}") from e
 
 
 def build(
@@ -124,43 +200,61 @@ def build(
     workers: int = 32,
 ) -> Tortilla:
     """Build root tortilla with all samples."""
-    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from multiprocessing import Pool
     from dataset.config import LEVEL0_SAMPLE_LIMIT
     
     if contexts is None:
         contexts = load_contexts(limit=LEVEL0_SAMPLE_LIMIT)
     
+    # Only the WorkerCtx fields (id, path, satellite_type, global_json) cross the process boundary
+    contexts = to_worker_contexts(contexts)
+    
+    # Results are consumed as workers finish them and split straight into
+    # the three per-type lists (no intermediate list of result tuples)
+    samples, cloud3d_metas, cyclone_metas = [], [], []
+    
+    def collect(results):
+        for sample, cloud3d_meta, cyclone_meta in results:
+            samples.append(sample)
+            cloud3d_metas.append(cloud3d_meta)
+            cyclone_metas.append(cyclone_meta)
+    
     if parallel and len(contexts) > 1:
-        samples = []
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(build_sample, ctx): ctx["id"] for ctx in contexts}
-            for future in as_completed(futures):
-                sample_id = futures[future]
-                try:
-                    sample = future.result()
-                    samples.append(sample)
-                except Exception as e:
-                    print(f"Error processing {sample_id}: {e}")
-                    raise
+        # Batch task dispatch/result pickling: ~8 chunks per worker
+        chunksize = max(1, len(contexts) // (workers * 8))
+        try:
+            with Pool(workers) as pool:
+                collect(pool.imap_unordered(_build_sample_tagged, contexts, chunksize=chunksize))
+        except SampleBuildError as e:
+            print(e)
+            raise
     else:
-        samples = [build_sample(ctx) for ctx in contexts]
+        collect(_build_sample_tagged(ctx) for ctx in contexts)
     
-    return Tortilla(
+    tortilla = Tortilla(
         samples=samples,
         pad_to=PAD_TO,
         strict_schema=STRICT_SCHEMA,
     )
+    
+    # One Arrow table per extension type, rows aligned with samples
+    tortilla.extend_with(SampleColumns.from_instances(cloud3d_metas))
+    tortilla.extend_with(SampleColumns.from_instances(cyclone_metas))
+    
+    return tortilla
 
 
 if __name__ == "__main__":
     contexts = load_contexts(limit=2)
     print(f"Testing level0 with {len(contexts)} contexts...")
     
-    for ctx in contexts:
-        sample = build_sample(ctx)
-        print(f"\n{ctx['id']}:")
-        print(f"  Satellite: {ctx['satellite_type']}")
+    for ctx in to_worker_contexts(contexts):
+        sample, cloud3d_meta, cyclone_meta = build_sample(ctx)
+        print(f"\n{ctx.id}:")
+        print(f"  Satellite: {ctx.satellite_type}")
         print(f"  Children: {[s.id for s in sample.path.samples]}")
+        print(f"  Cloud3D: {cloud3d_meta._compute(sample).to_pylist()[0]}")
+        print(f"  Cyclone: {cyclone_meta._compute(sample).to_pylist()[0]}")
     
     print("\nBuilding full tortilla (sequential)...")
     tortilla = build(contexts, parallel=False)
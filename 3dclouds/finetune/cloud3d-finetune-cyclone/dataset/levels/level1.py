@@ -18,15 +18,17 @@ from tacotoolbox.datamodel import Sample, Tortilla
 from tacotoolbox.sample.extensions.tacotiff import Header
 from tacotoolbox.sample.extensions.geotiff_stats import GeotiffStats
 
+from dataset.metadata import WorkerCtx
+
 
 # Tortilla parameters
 PAD_TO = None
 STRICT_SCHEMA = True
 
 
-def build_geo_patch(ctx: dict) -> Sample:
+def build_geo_patch(ctx: WorkerCtx) -> Sample:
     """Build Sample for geostationary imagery (GOES or Himawari)."""
-    folder = Path(ctx["path"].decode() if isinstance(ctx["path"], bytes) else ctx["path"])
+    folder = Path(ctx.path)
     tif_path = folder / "geo_patch.tif"
     
     if not tif_path.exists():
@@ -39,9 +41,9 @@ def build_geo_patch(ctx: dict) -> Sample:
     return sample
 
 
-def build_cloudsat_aligned(ctx: dict) -> Sample:
+def build_cloudsat_aligned(ctx: WorkerCtx) -> Sample:
     """Build Sample for CloudSat radar profiles aligned to geostationary grid."""
-    folder = Path(ctx["path"].decode() if isinstance(ctx["path"], bytes) else ctx["path"])
+    folder = Path(ctx.path)
     tif_path = folder / "cloudsat_aligned.tif"
     
     if not tif_path.exists():
@@ -60,7 +62,7 @@ SAMPLES = [
 ]
 
 
-def build(ctx: dict) -> Tortilla:
+def build(ctx: WorkerCtx) -> Tortilla:
     """Build level1 Tortilla containing geo_patch and cloudsat_aligned files."""
     return Tortilla(
         samples=[fn(ctx) for fn in SAMPLES],
@@ -71,16 +73,16 @@ def build(ctx: dict) -> Tortilla:
 
 if __name__ == "__main__":
     # Test with first sample from metadata
-    from dataset.metadata import load_contexts
+    from dataset.metadata import load_contexts, to_worker_contexts
     
-    contexts = load_contexts(limit=2)
+    contexts = to_worker_contexts(load_contexts(limit=2))
     print(f"Testing level1 with {len(contexts)} contexts...")
     
     for ctx in contexts:
         tortilla = build(ctx)
-        print(f"\n{ctx['id']}:")
+        print(f"\n{ctx.id}:")
         print(f"  Samples: {[s.id for s in tortilla.samples]}")
-        print(f"  Satellite: {ctx.get('satellite_type', 'unknown')}")
+        print(f"  Satellite: {ctx.satellite_type}")
     
     print("\nSchema:")
     print(tortilla.export_metadata())
\ No newline at end of file
@@ -13,93 +13,95 @@ Each sample folder contains:
   - *_global.json          (read for metadata extraction)
 """
 
-import json
-import re
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import tacoreader
-if tacoreader.__version__ < "2.0.0":
-    raise ImportError(
-        f"tacoreader >= 2.0.0 required (found {tacoreader.__version__}). "
-        "Run: pip install -U tacoreader"
-    )
-
-from dataset.config import DATAFRAME_BACKEND
-
-tacoreader.use(DATAFRAME_BACKEND)
+from dataset._fastpath import detect_satellite
+from dataset.config import METADATA_WORKERS
+from dataset.extensions import read_global_attrs
 
 # Data directory
 DATA_DIR = Path("/data/databases/CLOUD_3D/finetune/geotiff/cyclones")
 
-# Patterns to detect satellite type
-GOES_PATTERN = re.compile(r"^G16_")
-HIMAWARI_PATTERN = re.compile(r"^\d{8}_")  # YYYYMMDD_
+# Compact per-sample payload sent to level0 workers. Everything else in the
+# context dict is re-derived from *_global.json inside the worker.
+WorkerCtx = namedtuple("WorkerCtx", "id path satellite_type global_json")
+
 
+def find_global_json(folder: Path) -> str | None:
+    """Return the path of the *_global.json in a sample folder, or None."""
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.name.endswith("_global.json"):
+                return entry.path
+    return None
 
-def detect_satellite(folder_name: str) -> str:
-    """Detect satellite type from folder name."""
-    if GOES_PATTERN.match(folder_name):
-        return "GOES-16"
-    elif HIMAWARI_PATTERN.match(folder_name):
-        return "Himawari"
+
+def _load_one(folder: Path) -> dict:
+    """Build the context dict for a single sample folder."""
+    folder_name = folder.name
+    satellite_type = detect_satellite(folder_name)
+    
+    # Locate global.json once; workers reuse the path instead of globbing again
+    global_json = find_global_json(folder)
+    attrs = read_global_attrs(global_json) if global_json is not None else {}
+    
+    ctx = {
+        "id": folder_name,
+        "path": str(folder),
+        "satellite_type": satellite_type,
+        "global_json": global_json,
+        "has_flxhr": "no_flxhr" not in folder_name,
+    }
+    
+    # Fields from global.json (attrs is empty if it is missing)
+    if satellite_type == "GOES-16":
+        ctx["goes_id"] = attrs.get("goes_id", folder_name)
+        ctx["himawari_id"] = None
     else:
-        raise ValueError(f"Unknown satellite pattern: {folder_name}")
+        ctx["himawari_id"] = attrs.get("himawari_id", folder_name)
+        ctx["goes_id"] = None
+    
+    ctx["cloudsat_id"] = attrs.get("cloudsat_id")
+    ctx["start"] = attrs.get("start")  # Timestamp for STAC
+    
+    return ctx
 
 
-def load_global_json(folder: Path) -> dict:
-    """Load *_global.json from sample folder."""
-    global_files = list(folder.glob("*_global.json"))
-    if not global_files:
-        return {}
-    with open(global_files[0], "r") as f:
-        return json.load(f)
+def to_worker_contexts(contexts: list[dict]) -> list[WorkerCtx]:
+    """Shrink context dicts to the fields level0/level1 builders actually use."""
+    return [
+        WorkerCtx(ctx["id"], ctx["path"], ctx["satellite_type"], ctx["global_json"])
+        for ctx in contexts
+    ]
 
 
 def load_contexts(limit: float | int | None = None) -> list[dict]:
     """
     Load cyclone dataset metadata.
 
+    Folders are read concurrently with METADATA_WORKERS threads (the scan is
+    IO-bound, so the GIL is released while waiting on stat/read calls).
+
     Returns context dicts with:
       - id: folder name (unique sample ID)
-      - path: folder path as bytes
+      - path: folder path as str
       - satellite_type: "GOES-16" or "Himawari"
+      - global_json: path of the sample's *_global.json as str (None if missing)
       - goes_id / himawari_id: satellite-specific ID from global.json
       - cloudsat_id: CloudSat granule ID from global.json
       - has_flxhr: whether FLXHR data is available
     """
-    contexts = []
+    # DirEntry.is_dir() answers from the d_type cached by readdir (no stat)
+    with os.scandir(DATA_DIR) as it:
+        entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    folders = [Path(e.path) for e in entries]
     
-    for folder in sorted(DATA_DIR.iterdir()):
-        if not folder.is_dir():
-            continue
-        
-        folder_name = folder.name
-        satellite_type = detect_satellite(folder_name)
-        
-        # Load metadata from global.json
-        global_meta = load_global_json(folder)
-        
-        ctx = {
-            "id": folder_name,
-            "path": str(folder).encode(),
-            "satellite_type": satellite_type,
-            "has_flxhr": "no_flxhr" not in folder_name,
-        }
-        
-        # Extract fields from global.json if available
-        attrs = global_meta.get("attributes", {})
-        
-        if satellite_type == "GOES-16":
-            ctx["goes_id"] = attrs.get("goes_id", folder_name)
-            ctx["himawari_id"] = None
-        else:
-            ctx["himawari_id"] = attrs.get("himawari_id", folder_name)
-            ctx["goes_id"] = None
-        
-        ctx["cloudsat_id"] = attrs.get("cloudsat_id")
-        ctx["start"] = attrs.get("start")  # Timestamp for STAC
-        
-        contexts.append(ctx)
+    # executor.map keeps input order, so contexts stay sorted by id
+    with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as executor:
+        contexts = list(executor.map(_load_one, folders))
     
     # Apply limit
     if limit is None:
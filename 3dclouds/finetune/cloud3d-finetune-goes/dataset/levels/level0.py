@@ -31,12 +31,9 @@ from dataset.extensions import Cloud3DMetadata
 from dataset.metadata import load_contexts
 
 
-# Split configuration based on day of month
-SPLIT_DAYS = {
-    "train": list(range(1, 24)),       # Days 1-23
-    "validation": list(range(24, 28)), # Days 24-27
-    "test": list(range(28, 32)),       # Days 28-31
-}
+# Split configuration based on day of month, indexed by day (index 0 unused):
+# days 1-23 train, 24-27 validation, 28-31 test
+_DAY_SPLIT = ("test",) + ("train",) * 23 + ("validation",) * 4 + ("test",) * 4
 
 
 def determine_split(timestamp_us: int) -> Literal["train", "validation", "test"]:
@@ -51,15 +48,7 @@ def determine_split(timestamp_us: int) -> Literal["train", "validation", "test"]
     Args:
         timestamp_us: Timestamp in microseconds since Unix epoch
     """
-    dt = datetime.fromtimestamp(timestamp_us / 1_000_000)
-    day = dt.day
-    
-    if day in SPLIT_DAYS["train"]:
-        return "train"
-    elif day in SPLIT_DAYS["validation"]:
-        return "validation"
-    else:
-        return "test"
+    return _DAY_SPLIT[datetime.fromtimestamp(timestamp_us / 1_000_000).day]
 
 
 def extract_stac_metadata(ref_file: Path) -> STAC:
@@ -25,17 +25,10 @@ Usage:
     contexts = load_contexts(limit=10)
 """
 
-import tacoreader
-if tacoreader.__version__ < "2.0.0":
-    raise ImportError(
-        f"tacoreader >= 2.0.0 required (found {tacoreader.__version__}). "
-        "Run: pip install -U tacoreader"
-    )
-
+import os
 from pathlib import Path
-from dataset.config import DATAFRAME_BACKEND
 
-tacoreader.use(DATAFRAME_BACKEND)
+import dataset.config  # noqa: F401 - version checks and DataFrame backend
 
 # Root path to GOES-CloudSat colocated data
 ROOT_PATH = Path("/data/databases/CLOUD_3D/finetune/geotiff/cloudsat_goes/")
@@ -56,14 +49,12 @@ def load_contexts(limit: float | int | None = None) -> list[dict]:
             - "id": directory name (e.g., "G16_xxx_001")
             - "path": Path object to directory
     """
-    # Scan for GOES directories
-    goes_dirs = sorted(ROOT_PATH.glob("G16_*"))
-    
-    contexts = [
-        {"id": d.name, "path": d}
-        for d in goes_dirs
-        if d.is_dir()
-    ]
+    # Scan for GOES directories (one listing; is_dir() uses the d_type from readdir)
+    # Sorted by DirEntry.name (plain str), before any Path objects exist
+    with os.scandir(ROOT_PATH) as it:
+        entries = [e for e in it if e.name.startswith("G16_") and e.is_dir()]
+    entries.sort(key=lambda e: e.name)
+    contexts = [{"id": e.name, "path": Path(e.path)} for e in entries]
     
     # Apply limit
     if limit is None:
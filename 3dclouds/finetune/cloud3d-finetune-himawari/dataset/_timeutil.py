@@ -0,0 +1,50 @@
+"""
+Timestamp and split helpers - Cloud3D Himawari
+
+Used once per sample by levels/level0.py. Free of third-party imports at module
+level (dateutil is only loaded for layouts fromisoformat rejects), so they can
+be imported and tested without the raster stack.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Literal
+
+# Split configuration based on day of month, indexed by tm_mday (index 0 unused):
+# days 1-23 train, 24-27 validation, 28-31 test
+_SPLIT_BY_DAY = ("test",) + ("train",) * 23 + ("validation",) * 4 + ("test",) * 4
+
+
+def determine_split(timestamp_us: int) -> Literal["train", "validation", "test"]:
+    """
+    Determine train/val/test split based on acquisition date (UTC).
+
+    Split logic:
+        - train: days 1-23 of any month
+        - validation: days 24-27 of any month
+        - test: days 28-31 of any month
+
+    Args:
+        timestamp_us: Timestamp in microseconds since Unix epoch
+    """
+    return _SPLIT_BY_DAY[time.gmtime(timestamp_us // 1_000_000).tm_mday]
+
+
+def parse_time_us(value: str) -> int:
+    """
+    Parse an ISO 8601 timestamp into integer microseconds since Unix epoch.
+
+    Uses the C-implemented datetime.fromisoformat and falls back to
+    dateutil's isoparse for layouts it does not accept. Timestamps without
+    an offset are taken as UTC (never host-local time), matching
+    determine_split. Whole seconds and microseconds are combined as
+    integers (no float rounding).
+    """
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        from dateutil.parser import isoparse
+        dt = isoparse(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000 + dt.microsecond
@@ -5,12 +5,24 @@ Edit the variables below to configure your dataset.
 DO NOT EDIT the COLLECTION dictionary at the bottom.
 """
 
+from packaging.version import Version
+
+import tacoreader
 import tacotoolbox
-if tacotoolbox.__version__ < "0.22.0":
-    raise ImportError(
-        f"tacotoolbox >= 0.22.0 required (found {tacotoolbox.__version__}). "
-        "Run: pip install -U tacotoolbox"
-    )
+
+
+def _check_version(module, minimum: str) -> None:
+    """Raise ImportError if an installed package is older than minimum (PEP 440 comparison)."""
+    if Version(module.__version__) < Version(minimum):
+        raise ImportError(
+            f"{module.__name__} >= {minimum} required (found {module.__version__}). "
+            f"Run: pip install -U {module.__name__}"
+        )
+
+
+# Checked once, when the dataset package first imports its config
+_check_version(tacotoolbox, "0.22.0")
+_check_version(tacoreader, "2.0.0")
 
 from tacotoolbox.datamodel.taco import Provider, Curator, Publication, Publications
 
@@ -77,11 +89,13 @@ COLLECTION_PUBLICATIONS = Publications(
 
 # DataFrame backend for testing/debugging output
 DATAFRAME_BACKEND = "pandas"  # "pyarrow", "polars", "pandas"
+tacoreader.use(DATAFRAME_BACKEND)
 
 # Parallel processing
 WORKERS = 8
 LEVEL0_PARALLEL = True
 LEVEL0_SAMPLE_LIMIT = None  # None = all samples, set number for debugging
+BATCH_STAT = False          # Check entries with concurrent stat() calls (NFS/FUSE mounts without d_type)
 
 # Output settings
 OUTPUT_PATH = "/data/databases/CLOUD_3D/pretraining/tacos/finetune/himawari/himawari.tacozip"
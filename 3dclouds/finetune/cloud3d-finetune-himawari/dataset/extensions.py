@@ -18,17 +18,29 @@ Each extension must implement 3 methods:
 - _compute() -> returns PyArrow Table with the actual metadata values
 """
 
-import json
-import re
+import os
 from pathlib import Path
 from typing import Literal
 
+import orjson
 import pyarrow as pa
 from pydantic import Field
 
 from tacotoolbox.sample.datamodel import SampleExtension
 
 
+def _read_bytes(path: str) -> bytes:
+    """Read a small file with raw os.read calls (no buffered IO layer)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 class Cloud3DMetadata(SampleExtension):
     """
     Cloud3D dataset-specific metadata for GOES-CloudSat colocated samples.
@@ -94,6 +106,7 @@ class Cloud3DMetadata(SampleExtension):
         directory: Path,
         satellite: Literal["GOES", "Himawari", "MSG"] = "GOES",
         is_cyclone: bool = False,
+        metadata_file: str | None = None,
     ) -> "Cloud3DMetadata":
         """
         Create Cloud3DMetadata by reading from a sample directory.
@@ -102,27 +115,28 @@ class Cloud3DMetadata(SampleExtension):
             directory: Path to sample directory containing *_global.json
             satellite: Geostationary satellite source
             is_cyclone: Whether this is a cyclone sample
+            metadata_file: Path of the *_global.json if already known
+                (skips the directory listing)
 
         Returns:
             Cloud3DMetadata instance with extracted values
         """
-        # Find metadata JSON
-        json_files = list(directory.glob("*_global.json"))
-        if not json_files:
+        # Find metadata JSON (single readdir, no glob pattern matching)
+        if metadata_file is None:
+            with os.scandir(directory) as it:
+                metadata_file = next((e.path for e in it if e.name.endswith("_global.json")), None)
+        if metadata_file is None:
             raise FileNotFoundError(f"No *_global.json found in {directory}")
         
-        metadata_file = json_files[0]
-        
         # Read JSON metadata
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
+        metadata = orjson.loads(_read_bytes(metadata_file))
         
         # Extract IDs from filenames
         geostationary_id = Path(metadata["attributes"]["satellite_filename"]).stem
         cloudsat_id = Path(metadata["attributes"]["cloudsat_filename"]).stem
         
         # Check for FLXHR availability (no_flxhr in directory name means NOT available)
-        has_flxhr = re.search(r"no_flxhr", directory.name) is None
+        has_flxhr = "no_flxhr" not in directory.name
         
         return cls(
             cyclone=is_cyclone,
@@ -13,53 +13,45 @@ Extensions applied at this level:
     - Cloud3DMetadata: Dataset-specific fields (from JSON + directory name)
 """
 
-from datetime import datetime
+import logging
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Literal
+from typing import Iterator
 
 import numpy as np
 import rasterio as rio
 import shapely
-from dateutil.parser import isoparse
+from tqdm import tqdm
 
 from tacotoolbox.datamodel import Sample, Tortilla
 from tacotoolbox.sample.extensions.stac import STAC
 from tacotoolbox.sample.extensions.split import Split
 
+from dataset._timeutil import determine_split, parse_time_us
 from dataset.levels.level1 import build as build_level1
 from dataset.extensions import Cloud3DMetadata
-from dataset.metadata import load_contexts
+from dataset.metadata import Ctx, load_contexts
 
+logger = logging.getLogger(__name__)
 
-# Split configuration based on day of month
-SPLIT_DAYS = {
-    "train": list(range(1, 24)),       # Days 1-23
-    "validation": list(range(24, 28)), # Days 24-27
-    "test": list(range(28, 32)),       # Days 28-31
+# GDAL options for reading geo_patch.tif; EMPTY_DIR stops GDAL from listing
+# each sample directory (looking for sidecar files) on every open
+GDAL_ENV = {
+    "GDAL_CACHEMAX": 512,
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "VSI_CACHE": "TRUE",
 }
 
+# Workers fork from a server that has already imported this module
+# (rasterio, tacotoolbox, ...), instead of from the parent process
+_MP_CONTEXT = multiprocessing.get_context("forkserver")
+_MP_CONTEXT.set_forkserver_preload([__name__])
 
-def determine_split(timestamp_us: int) -> Literal["train", "validation", "test"]:
-    """
-    Determine train/val/test split based on acquisition date.
-    
-    Split logic:
-        - train: days 1-23 of any month
-        - validation: days 24-27 of any month
-        - test: days 28-31 of any month
-    
-    Args:
-        timestamp_us: Timestamp in microseconds since Unix epoch
-    """
-    dt = datetime.fromtimestamp(timestamp_us / 1_000_000)
-    day = dt.day
-    
-    if day in SPLIT_DAYS["train"]:
-        return "train"
-    elif day in SPLIT_DAYS["validation"]:
-        return "validation"
-    else:
-        return "test"
+
+def _worker_init() -> None:
+    """Pool initializer: apply GDAL_ENV through the environment, read by GDAL on every open."""
+    os.environ.update({key: str(value) for key, value in GDAL_ENV.items()})
 
 
 def extract_stac_metadata(ref_file: Path) -> STAC:
@@ -68,35 +60,44 @@ def extract_stac_metadata(ref_file: Path) -> STAC:
     
     Note: STAC expects timestamps in microseconds (int), not seconds (float).
     """
+    # Read everything needed in one pass; only primitives leave the block
     with rio.open(ref_file) as src:
-        metadata = src.meta
+        crs_str = src.crs.to_string()
+        tensor_shape = (src.count, src.height, src.width)
+        geotransform = src.transform.to_gdal()
         tags = src.tags()
     
     # Convert to microseconds (STAC requirement)
-    acquisition_time_us = int(isoparse(tags["acquisition_time"]).timestamp() * 1_000_000)
+    acquisition_time_us = parse_time_us(tags["acquisition_time"])
     
     return STAC(
-        crs=metadata["crs"].to_string(),
-        tensor_shape=(metadata["count"], metadata["height"], metadata["width"]),
-        geotransform=metadata["transform"].to_gdal(),
+        crs=crs_str,
+        tensor_shape=tensor_shape,
+        geotransform=geotransform,
         time_start=acquisition_time_us,
         time_end=acquisition_time_us,
     )
 
 
-def build_sample(ctx: dict) -> Sample | None:
+def build_sample(ctx: Ctx) -> tuple[Sample, bytes] | None:
     """
     Build a single FOLDER sample from context.
     
+    Geometry is not validated here; build() checks all centroids at once.
+    
     Args:
-        ctx: Context dict with 'id' and 'path' keys
+        ctx: Ctx with id, path and metadata_file
         
     Returns:
-        Sample object or None if invalid
+        (Sample, STAC centroid WKB) or None if the sample could not be built
     """
     try:
-        sample_id: str = ctx["id"]
-        sample_path: Path = ctx["path"]
+        sample_id: str = ctx.id
+        sample_path: Path = ctx.path
+        
+        # Extract STAC metadata from geo_patch.tif
+        geo_patch_file = sample_path / "geo_patch.tif"
+        stac = extract_stac_metadata(geo_patch_file)
         
         # Build level1 Tortilla (FILE samples)
         tortilla = build_level1(ctx)
@@ -107,19 +108,8 @@ def build_sample(ctx: dict) -> Sample | None:
             type="FOLDER",
             path=tortilla,
         )
-        
-        # Extract STAC metadata from geo_patch.tif
-        geo_patch_file = sample_path / "geo_patch.tif"
-        stac = extract_stac_metadata(geo_patch_file)
         sample.extend_with(stac)
         
-        # Validate geometry
-        sample_data = sample.model_dump()
-        shapely_geom = shapely.from_wkb(sample_data["stac:centroid"])
-        if not shapely.is_valid(shapely_geom) or np.isinf(shapely_geom.bounds).any():
-            print(f"Invalid geometry for {sample_id}")
-            return None
-        
         # Determine split based on acquisition time
         split = determine_split(stac.time_start)
         sample.extend_with(Split(split=split))
@@ -129,21 +119,45 @@ def build_sample(ctx: dict) -> Sample | None:
             directory=sample_path,
             satellite="Himawari",
             is_cyclone=False,
+            metadata_file=ctx.metadata_file,
         )
         sample.extend_with(cloud3d_meta)
         
-        return sample
+        return sample, stac.centroid
         
     except Exception as e:
-        print(f"Error processing {ctx.get('id', 'unknown')}: {e}")
+        logger.warning("Error processing %s: %s", ctx.id, e)
         return None
 
 
 SAMPLES = [build_sample]
 
 
+def iter_samples(
+    contexts: list[Ctx],
+    parallel: bool = False,
+    workers: int = 4,
+) -> Iterator[tuple[Sample, bytes]]:
+    """
+    Yield (sample, centroid WKB) as samples are built; failed (None) ones are never stored.
+    
+    In parallel mode samples arrive in completion order, not context order.
+    """
+    if not parallel:
+        with rio.Env(**GDAL_ENV):
+            # filter(None, ...) drops failed samples in C (results are non-empty tuples)
+            yield from filter(None, map(build_sample, tqdm(contexts, desc="level0 samples")))
+        return
+    
+    # Stream results as they finish, ~8 chunks per worker to amortize IPC
+    chunksize = max(1, len(contexts) // (workers * 8))
+    with _MP_CONTEXT.Pool(workers, initializer=_worker_init) as pool:
+        results = pool.imap_unordered(build_sample, contexts, chunksize=chunksize)
+        yield from filter(None, tqdm(results, total=len(contexts), desc="level0 samples"))
+
+
 def build(
-    contexts: list[dict],
+    contexts: list[Ctx],
     parallel: bool = False,
     workers: int = 4,
 ) -> Tortilla:
@@ -151,22 +165,30 @@ def build(
     Build root Tortilla from all contexts.
     
     Args:
-        contexts: List of context dicts
+        contexts: List of Ctx
         parallel: Whether to use parallel processing
         workers: Number of parallel workers
         
     Returns:
         Root Tortilla with all valid samples
     """
+    results = list(iter_samples(contexts, parallel=parallel, workers=workers))
+    
+    # Parallel results come in completion order; restore context (id) order
     if parallel:
-        from multiprocessing import Pool
-        with Pool(workers) as pool:
-            samples = pool.map(build_sample, contexts)
-    else:
-        samples = [build_sample(ctx) for ctx in contexts]
+        results.sort(key=lambda r: r[0].id)
+    
+    # Validate all centroids in one vectorized shapely pass
+    geoms = shapely.from_wkb(np.array([wkb for _, wkb in results], dtype=object))
+    is_valid = shapely.is_valid(geoms) & ~np.isinf(shapely.bounds(geoms)).any(axis=1)
+    
+    valid_samples = []
+    for (sample, _), ok in zip(results, is_valid):
+        if ok:
+            valid_samples.append(sample)
+        else:
+            logger.warning("Invalid geometry for %s", sample.id)
     
-    # Filter out None (invalid) samples
-    valid_samples = [s for s in samples if s is not None]
     print(f"Built {len(valid_samples)}/{len(contexts)} valid samples")
     
     return Tortilla(samples=valid_samples)
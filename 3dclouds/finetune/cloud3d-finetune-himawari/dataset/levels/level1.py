@@ -9,7 +9,7 @@ Structure:
 
 How to use:
     1. Define your sample builders (one function per file type)
-    2. Each builder receives a context dict and returns a Sample
+    2. Each builder receives a context (Ctx) and returns a Sample
     3. Add extensions to extract metadata (Header, GeotiffStats, STAC, etc.)
     4. Add your builders to the SAMPLES list
 
@@ -30,7 +30,7 @@ from tacotoolbox.datamodel import Sample, Tortilla
 from tacotoolbox.sample.extensions.tacotiff import Header
 from tacotoolbox.sample.extensions.geotiff_stats import GeotiffStats
 
-from dataset.metadata import load_contexts
+from dataset.metadata import Ctx, load_contexts
 
 
 # Tortilla parameters
@@ -38,7 +38,7 @@ PAD_TO = None
 STRICT_SCHEMA = True
 
 
-def build_sample_geo_patch(ctx: dict) -> Sample:
+def build_sample_geo_patch(ctx: Ctx) -> Sample:
     """
     Himawari-8/9 AHI geostationary imagery.
     
@@ -48,14 +48,14 @@ def build_sample_geo_patch(ctx: dict) -> Sample:
     
     Format: Cloud-Optimized GeoTIFF, 256x256 pixels
     """
-    path: Path = ctx["path"]
+    path: Path = ctx.path
     sample = Sample(id="geo_patch", path=path / "geo_patch.tif")
     sample.extend_with(Header())
     sample.extend_with(GeotiffStats())
     return sample
 
 
-def build_sample_cloudsat(ctx: dict) -> Sample:
+def build_sample_cloudsat(ctx: Ctx) -> Sample:
     """
     CloudSat radar profile (ground truth).
     
@@ -64,7 +64,7 @@ def build_sample_cloudsat(ctx: dict) -> Sample:
     
     Format: Cloud-Optimized GeoTIFF
     """
-    path: Path = ctx["path"]
+    path: Path = ctx.path
     sample = Sample(id="cloudsat_aligned", path=path / "cloudsat_aligned.tif")
     sample.extend_with(Header())
     sample.extend_with(GeotiffStats())
@@ -77,7 +77,7 @@ SAMPLES = [
 ]
 
 
-def build(ctx: dict) -> Tortilla:
+def build(ctx: Ctx) -> Tortilla:
     """Build level1 Tortilla from context."""
     return Tortilla(
         samples=[fn(ctx) for fn in SAMPLES],
@@ -91,5 +91,5 @@ if __name__ == "__main__":
     print(f"Testing level1 with {len(contexts)} contexts...")
     for ctx in contexts:
         tortilla = build(ctx)
-        print(f"  {ctx['id']}: {len(tortilla.samples)} samples")
+        print(f"  {ctx.id}: {len(tortilla.samples)} samples")
     print("Done!")
\ No newline at end of file
@@ -3,12 +3,12 @@ Metadata Provider
 
 This module loads your dataset metadata and provides it as contexts.
 
-A "context" is a dict containing all information needed to build one root sample.
+A "context" (Ctx, a NamedTuple) holds all information needed to build one root sample.
 - REQUIRED: "id" field (unique identifier)
 - OPTIONAL: any other fields your levels need (paths, coordinates, dates, etc.)
 
 How contexts flow through TACO:
-1. load_contexts() returns list[dict]
+1. load_contexts() returns list[Ctx]
 2. level0.build() iterates over all contexts
 3. Each context is passed to level1.build() → level2.build() → ... → leaf level
 4. Levels use context fields to locate files, apply extensions, build samples
@@ -25,50 +25,55 @@ Usage:
     contexts = load_contexts(limit=10)
 """
 
-"""
-Metadata Provider
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
 
-This module loads your dataset metadata and provides it as contexts.
+from dataset.config import BATCH_STAT, WORKERS
 
-A "context" is a dict containing all information needed to build one root sample.
-- REQUIRED: "id" field (unique identifier)
-- OPTIONAL: any other fields your levels need (paths, coordinates, dates, etc.)
+# Root path to Himawari-CloudSat colocated data
+ROOT_PATH = Path("/data/databases/CLOUD_3D/finetune/geotiff/cloudsat_himawari/")
 
-How contexts flow through TACO:
-1. load_contexts() returns list[dict]
-2. level0.build() iterates over all contexts
-3. Each context is passed to level1.build() → level2.build() → ... → leaf level
-4. Levels use context fields to locate files, apply extensions, build samples
 
-The limit parameter enables testing with a subset of your data.
+class Ctx(NamedTuple):
+    """Context for one Himawari sample directory (fixed layout, attribute access)."""
 
-Usage:
-    from dataset.metadata import load_contexts
+    id: str
+    path: Path
+    metadata_file: str | None  # *_global.json inside path, None if missing
 
-    # Load all contexts
-    contexts = load_contexts()
-
-    # Load subset for testing
-    contexts = load_contexts(limit=10)
-"""
 
-import tacoreader
-if tacoreader.__version__ < "2.0.0":
-    raise ImportError(
-        f"tacoreader >= 2.0.0 required (found {tacoreader.__version__}). "
-        "Run: pip install -U tacoreader"
-    )
+def _batch_isdir(
+    entries: list[os.DirEntry],
+    batch: int = 4096,
+    workers: int = WORKERS,
+) -> list[bool]:
+    """
+    DirEntry.is_dir() for many entries, with stat() fallbacks issued concurrently.
 
-from pathlib import Path
-from dataset.config import DATAFRAME_BACKEND
+    Where readdir reports d_type (ext4, xfs) is_dir() needs no syscall and this
+    is just a loop. Where it reports DT_UNKNOWN (some NFS/FUSE mounts) every
+    call is a blocking stat(); with BATCH_STAT set in config.py these are run
+    `batch` at a time on a thread pool.
+    """
+    if not BATCH_STAT or len(entries) < 2:
+        return [e.is_dir() for e in entries]
+    
+    flags = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i in range(0, len(entries), batch):
+            flags.extend(executor.map(lambda e: e.is_dir(), entries[i:i + batch]))
+    return flags
 
-tacoreader.use(DATAFRAME_BACKEND)
 
-# Root path to Himawari-CloudSat colocated data
-ROOT_PATH = Path("/data/databases/CLOUD_3D/finetune/geotiff/cloudsat_himawari/")
+def _find_global_json(entry: os.DirEntry) -> str | None:
+    """Return the path of the *_global.json inside a sample directory, or None."""
+    with os.scandir(entry.path) as it:
+        return next((e.path for e in it if e.name.endswith("_global.json")), None)
 
 
-def load_contexts(limit: float | int | None = None) -> list[dict]:
+def load_contexts(limit: float | int | None = None) -> list[Ctx]:
     """
     Load Himawari-CloudSat directory paths as contexts.
 
@@ -79,28 +84,33 @@ def load_contexts(limit: float | int | None = None) -> list[dict]:
                - int: exact count
 
     Returns:
-        list[dict]: One dict per Himawari directory
-            - "id": directory name (e.g., "H08_xxx_001")
-            - "path": Path object to directory
+        list[Ctx]: One Ctx per Himawari directory
+            - id: directory name (e.g., "H08_xxx_001")
+            - path: Path object to directory
+            - metadata_file: path of its *_global.json as str (None if missing)
     """
-    # Scan for Himawari directories
-    himawari_dirs = sorted(ROOT_PATH.glob("*"))
+    # Scan for Himawari directories (one listing, dot-entries skipped)
+    # Sorted by DirEntry.name (plain str), before any Path objects exist
+    with os.scandir(ROOT_PATH) as it:
+        entries = [e for e in it if not e.name.startswith(".")]
+    entries = [e for e, is_dir in zip(entries, _batch_isdir(entries)) if is_dir]
+    entries.sort(key=lambda e: e.name)
     
-    contexts = [
-        {"id": d.name, "path": d}
-        for d in himawari_dirs
-        if d.is_dir()
-    ]
+    # Apply limit (before the per-directory lookups below)
+    if isinstance(limit, float):
+        count = int(len(entries) * limit) or 1
+        entries = entries[:count]
+    elif limit is not None:
+        entries = entries[:limit]
     
-    # Apply limit
-    if limit is None:
-        return contexts
-    elif isinstance(limit, float):
-        count = int(len(contexts) * limit) or 1
-        return contexts[:count]
-    else:
-        return contexts[:limit]
-
+    # Locate each *_global.json now so build_sample never lists the directory again
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        metadata_files = list(executor.map(_find_global_json, entries))
+    
+    return [
+        Ctx(e.name, Path(e.path), metadata_file)
+        for e, metadata_file in zip(entries, metadata_files)
+    ]
 
 if __name__ == "__main__":
     contexts = load_contexts()
@@ -19,15 +19,15 @@ from tacotoolbox.taco.datamodel import Taco
 
 from dataset.config import COLLECTION, LEVEL0_SAMPLE_LIMIT
 from dataset.tortilla import create_tortilla
-from dataset.metadata import load_contexts
+from dataset.metadata import Ctx, load_contexts
 
 
-def create_taco(contexts: list[dict] | None = None) -> Taco:
+def create_taco(contexts: list[Ctx] | None = None) -> Taco:
     """
     Create complete TACO from Tortilla + COLLECTION metadata.
     
     Args:
-        contexts: List of context dicts, if None uses load_contexts(LEVEL0_SAMPLE_LIMIT)
+        contexts: List of Ctx, if None uses load_contexts(LEVEL0_SAMPLE_LIMIT)
     
     Returns:
         Taco: Complete TACO dataset
@@ -10,21 +10,31 @@ Extensions:
 - GeoEnrich: Earth Engine data (elevation, precipitation, etc.)
 """
 
-import ee
+import functools
+import logging
 
 from tacotoolbox.datamodel import Tortilla
 from tacotoolbox.tortilla.extensions.majortom import MajorTOM
 from tacotoolbox.tortilla.extensions.geoenrich import GeoEnrich
 
 from dataset.levels.level0 import build as build_level0
-from dataset.metadata import load_contexts
+from dataset.metadata import Ctx, load_contexts
 from dataset.config import LEVEL0_SAMPLE_LIMIT, LEVEL0_PARALLEL, WORKERS
 
-ee.Initialize()
+# Per-sample problems in level0 are reported as logging warnings
+logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+
+# Earth Engine is only needed by GeoEnrich; level0 workers never initialize it
+@functools.lru_cache(maxsize=1)
+def _ensure_ee() -> None:
+    """Import and initialize Earth Engine once per process, on first call."""
+    import ee
+    ee.Initialize()
 
 
 def create_tortilla(
-    contexts: list[dict] | None = None,
+    contexts: list[Ctx] | None = None,
     parallel: bool | None = None,
     workers: int | None = None,
 ) -> Tortilla:
@@ -32,7 +42,7 @@ def create_tortilla(
     Build root Tortilla from level0.
     
     Args:
-        contexts: List of context dicts, if None uses load_contexts(LEVEL0_SAMPLE_LIMIT)
+        contexts: List of Ctx, if None uses load_contexts(LEVEL0_SAMPLE_LIMIT)
         parallel: Enable parallel processing, if None uses LEVEL0_PARALLEL from config
         workers: Number of workers, if None uses WORKERS from config
     
@@ -59,6 +69,7 @@ def create_tortilla(
     
     # GeoEnrich extension - Earth Engine data
     print("Applying GeoEnrich extension...")
+    _ensure_ee()
     root_tortilla.extend_with(GeoEnrich(
         variables=["elevation", "precipitation", "temperature", "admin_countries"],
         batch_size=250,
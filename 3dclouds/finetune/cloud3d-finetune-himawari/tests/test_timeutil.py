@@ -0,0 +1,49 @@
+"""
+Split assignment must follow the UTC acquisition day whatever the host TZ is.
+
+Run from the recipe root:
+    python -m pytest tests
+"""
+
+import calendar
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dataset._timeutil import determine_split, parse_time_us  # noqa: E402
+
+
+@pytest.fixture
+def non_utc_tz(monkeypatch):
+    """Run the test with the host clock at UTC+2 (POSIX sign is inverted in Etc/GMT-2)."""
+    monkeypatch.setenv("TZ", "Etc/GMT-2")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2020-01-24T01:00:00", "2020-01-24T01:00:00Z", "2020-01-24T01:00:00+00:00"],
+)
+def test_naive_and_utc_tags_parse_as_utc(non_utc_tz, value):
+    expected = calendar.timegm((2020, 1, 24, 1, 0, 0)) * 1_000_000
+    assert parse_time_us(value) == expected
+
+
+def test_split_uses_utc_day_under_non_utc_tz(non_utc_tz):
+    # 01:00 UTC on the 24th is validation; read as local UTC+2 it would
+    # become 23:00 UTC on the 23rd (train)
+    assert determine_split(parse_time_us("2020-01-24T01:00:00")) == "validation"
+    assert determine_split(parse_time_us("2020-01-27T23:30:00")) == "validation"
+    assert determine_split(parse_time_us("2020-01-28T00:30:00")) == "test"
+
+
+def test_microseconds_are_kept(non_utc_tz):
+    assert parse_time_us("2020-01-24T01:00:00.123456") % 1_000_000 == 123456
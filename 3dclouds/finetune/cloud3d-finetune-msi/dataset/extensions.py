@@ -18,11 +18,11 @@ Each extension must implement 3 methods:
 - _compute() -> returns PyArrow Table with the actual metadata values
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Literal
 
+import orjson
 import pyarrow as pa
 from pydantic import Field
 
@@ -113,9 +113,8 @@ class Cloud3DMetadata(SampleExtension):
         
         metadata_file = json_files[0]
         
-        # Read JSON metadata
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
+        # Read JSON metadata (raw bytes straight into the parser)
+        metadata = orjson.loads(metadata_file.read_bytes())
         
         # Extract IDs from filenames
         geostationary_id = Path(metadata["attributes"]["satellite_filename"]).stem
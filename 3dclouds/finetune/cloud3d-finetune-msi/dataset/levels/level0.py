@@ -13,7 +13,6 @@ Extensions applied at this level:
     - Cloud3DMetadata: Dataset-specific fields (from JSON + directory name)
 """
 
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -31,60 +30,48 @@ from dataset.extensions import Cloud3DMetadata
 from dataset.metadata import load_contexts
 
 
-# Split configuration based on day of month
-SPLIT_DAYS = {
-    "train": list(range(1, 24)),       # Days 1-23
-    "validation": list(range(24, 28)), # Days 24-27
-    "test": list(range(28, 32)),       # Days 28-31
-}
+# Split configuration based on day of month, indexed by day (index 0 unused):
+# days 1-23 train, 24-27 validation, 28-31 test
+_DAY_SPLIT = ("test",) + ("train",) * 23 + ("validation",) * 4 + ("test",) * 4
 
+# One validated Split extension per partition, shared by all samples
+_SPLITS = {name: Split(split=name) for name in ("train", "validation", "test")}
 
-def parse_timestamp_from_dirname(dirname: str) -> int:
-    """
-    Parse timestamp from MSG directory name.
-    
-    Pattern: MSG1_20060613001240_CS_...
-                  ↑↑↑↑↑↑↑↑↑↑↑↑↑↑
-                  YYYYMMDDHHmmss
-    
-    Args:
-        dirname: Directory name (e.g., "MSG1_20060613001240_CS_2006163223419_00664_merged_patch_00")
-        
-    Returns:
-        Timestamp in microseconds since Unix epoch
-    """
-    # Extract timestamp string: MSG{N}_{TIMESTAMP}_CS_...
-    match = re.match(r"MSG\d+_(\d{14})_", dirname)
-    if not match:
+
+def _timestamp_field(dirname: str) -> str:
+    """Return the YYYYMMDDHHmmss field of an MSG directory name (validated)."""
+    # MSG{N}_{TIMESTAMP}_CS_... (fixed layout, so split instead of regex)
+    parts = dirname.split("_", 2)
+    if (
+        len(parts) < 3
+        or not parts[0].startswith("MSG")
+        or not parts[0][3:].isdigit()
+        or len(parts[1]) != 14
+        or not parts[1].isdigit()
+    ):
         raise ValueError(f"Cannot parse timestamp from: {dirname}")
-    
-    timestamp_str = match.group(1)  # "20060613001240"
-    dt = datetime.strptime(timestamp_str, "%Y%m%d%H%M%S")
-    
+    return parts[1]
+
+
+def _timestamp_us(ts: str) -> int:
+    """Convert a YYYYMMDDHHmmss string to microseconds since Unix epoch."""
+    dt = datetime(
+        int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+        int(ts[8:10]), int(ts[10:12]), int(ts[12:14]),
+    )
     return int(dt.timestamp() * 1_000_000)
 
 
-def determine_split(timestamp_us: int) -> Literal["train", "validation", "test"]:
+def determine_split_from_day(day: int) -> Literal["train", "validation", "test"]:
     """
-    Determine train/val/test split based on acquisition date.
+    Determine train/val/test split from the acquisition day of month.
     
     Split logic:
         - train: days 1-23 of any month
         - validation: days 24-27 of any month
         - test: days 28-31 of any month
-    
-    Args:
-        timestamp_us: Timestamp in microseconds since Unix epoch
     """
-    dt = datetime.fromtimestamp(timestamp_us / 1_000_000)
-    day = dt.day
-    
-    if day in SPLIT_DAYS["train"]:
-        return "train"
-    elif day in SPLIT_DAYS["validation"]:
-        return "validation"
-    else:
-        return "test"
+    return _DAY_SPLIT[day]
 
 
 def extract_stac_metadata(ref_file: Path, timestamp_us: int) -> STAC:
@@ -98,7 +85,9 @@ def extract_stac_metadata(ref_file: Path, timestamp_us: int) -> STAC:
     Returns:
         STAC extension with spatial/temporal metadata
     """
-    with rio.open(ref_file) as src:
+    # geo_patch.tif is always a GeoTIFF: skip driver probing and the shared
+    # dataset cache (opened for its header only, closed right away)
+    with rio.open(ref_file, driver="GTiff", sharing=False) as src:
         metadata = src.meta
     
     return STAC(
@@ -125,7 +114,8 @@ def build_sample(ctx: dict) -> Sample | None:
         sample_path: Path = ctx["path"]
         
         # Parse timestamp from directory name
-        timestamp_us = parse_timestamp_from_dirname(sample_id)
+        timestamp_str = _timestamp_field(sample_id)
+        timestamp_us = _timestamp_us(timestamp_str)
         
         # Build level1 Tortilla (FILE samples)
         tortilla = build_level1(ctx)
@@ -142,16 +132,16 @@ def build_sample(ctx: dict) -> Sample | None:
         stac = extract_stac_metadata(geo_patch_file, timestamp_us)
         sample.extend_with(stac)
         
-        # Validate geometry
-        sample_data = sample.model_dump()
-        shapely_geom = shapely.from_wkb(sample_data["stac:centroid"])
+        # Validate geometry (STAC computes the centroid WKB on construction,
+        # so read it from the extension instead of model_dump() of the sample)
+        shapely_geom = shapely.from_wkb(stac.centroid)
         if not shapely.is_valid(shapely_geom) or np.isinf(shapely_geom.bounds).any():
             print(f"Invalid geometry for {sample_id}")
             return None
         
-        # Determine split based on acquisition time
-        split = determine_split(timestamp_us)
-        sample.extend_with(Split(split=split))
+        # Determine split based on acquisition day (DD of the dirname timestamp)
+        split = determine_split_from_day(int(timestamp_str[6:8]))
+        sample.extend_with(_SPLITS[split])
         
         # Add Cloud3D-specific metadata
         cloud3d_meta = Cloud3DMetadata.from_directory(
@@ -189,13 +179,21 @@ def build(
     """
     if parallel:
         from multiprocessing import Pool
+        
+        # Results streamed in completion order, ~8 chunks per worker to amortize IPC
+        chunksize = max(1, len(contexts) // (workers * 8))
         with Pool(workers) as pool:
-            samples = pool.map(build_sample, contexts)
+            valid_samples = [
+                s for s in pool.imap_unordered(build_sample, contexts, chunksize=chunksize)
+                if s is not None
+            ]
+        
+        # Restore context order
+        order = {ctx["id"]: i for i, ctx in enumerate(contexts)}
+        valid_samples.sort(key=lambda s: order[s.id])
     else:
-        samples = [build_sample(ctx) for ctx in contexts]
+        valid_samples = [s for s in (build_sample(ctx) for ctx in contexts) if s is not None]
     
-    # Filter out None (invalid) samples
-    valid_samples = [s for s in samples if s is not None]
     print(f"Built {len(valid_samples)}/{len(contexts)} valid samples")
     
     return Tortilla(samples=valid_samples)
@@ -9,17 +9,10 @@ Each context represents one MSG directory containing:
     - *_global.json: Metadata (read for attributes, not stored)
 """
 
-import tacoreader
-if tacoreader.__version__ < "2.0.0":
-    raise ImportError(
-        f"tacoreader >= 2.0.0 required (found {tacoreader.__version__}). "
-        "Run: pip install -U tacoreader"
-    )
-
+import os
 from pathlib import Path
-from dataset.config import DATAFRAME_BACKEND
 
-tacoreader.use(DATAFRAME_BACKEND)
+import dataset.config  # noqa: F401 - version checks and DataFrame backend
 
 # Root path to MSG/SEVIRI-CloudSat colocated data
 ROOT_PATH = Path("/data/databases/CLOUD_3D/finetune/geotiff/cloudsat_msg/")
@@ -41,26 +34,26 @@ def load_contexts(limit: float | int | None = None) -> list[dict]:
             - path: Path to sample directory
     """
     # Scan for MSG sample directories (pattern: MSG*_*)
-    sample_dirs = sorted([
-        d for d in ROOT_PATH.iterdir() 
-        if d.is_dir() and d.name.startswith("MSG")
-    ])
+    # Cheap name filter first; DirEntry.is_dir() uses the d_type from readdir (no stat)
+    with os.scandir(ROOT_PATH) as it:
+        entries = [e for e in it if e.name.startswith("MSG") and e.is_dir()]
+    entries.sort(key=lambda e: e.name)
     
     # Apply limit if specified
     if limit is not None:
         if isinstance(limit, float) and 0 < limit < 1:
-            n_samples = int(len(sample_dirs) * limit)
-            sample_dirs = sample_dirs[:n_samples]
+            n_samples = int(len(entries) * limit)
+            entries = entries[:n_samples]
         elif isinstance(limit, int) and limit > 0:
-            sample_dirs = sample_dirs[:limit]
+            entries = entries[:limit]
     
-    # Build contexts
+    # Build contexts (Path objects only for the kept entries)
     contexts = [
         {
-            "id": d.name,
-            "path": d,
+            "id": e.name,
+            "path": Path(e.path),
         }
-        for d in sample_dirs
+        for e in entries
     ]
     
     return contexts
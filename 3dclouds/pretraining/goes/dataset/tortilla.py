@@ -15,7 +15,7 @@ Run directly to test:
     python tortilla.py
 """
 
-import ee
+import functools
 
 from tacotoolbox.datamodel import Tortilla
 from tacotoolbox.tortilla.extensions.majortom import MajorTOM
@@ -25,8 +25,14 @@ from dataset.levels.level0 import build
 from dataset.metadata import load_contexts
 from dataset.config import LEVEL0_SAMPLE_LIMIT, LEVEL0_PARALLEL, WORKERS
 
-#ee.Authenticate(auth_mode="notebook")
-ee.Initialize()
+# Earth Engine is only needed by GeoEnrich; level0 workers never initialize it
+@functools.lru_cache(maxsize=1)
+def _ensure_ee() -> None:
+    """Import and initialize Earth Engine once per process, on first call."""
+    import ee
+    #ee.Authenticate(auth_mode="notebook")
+    ee.Initialize()
+
 
 def create_tortilla(contexts: list[dict] | None = None, parallel: bool | None = None, workers: int | None = None) -> Tortilla:
     """
@@ -60,6 +66,7 @@ def create_tortilla(contexts: list[dict] | None = None, parallel: bool | None =
     
     # GeoEnrich extension - Earth Engine data
     print("Applying GeoEnrich extension...")
+    _ensure_ee()
     root_tortilla.extend_with(GeoEnrich(
         variables=["elevation", "precipitation", "temperature", "admin_countries"],
         batch_size=250,
@@ -5,12 +5,22 @@ Edit the variables below to configure your dataset.
 DO NOT EDIT the COLLECTION dictionary at the bottom.
 """
 
+from packaging.version import Version
+
 import tacotoolbox
-if tacotoolbox.__version__ < "0.22.0":
-    raise ImportError(
-        f"tacotoolbox >= 0.22.0 required (found {tacotoolbox.__version__}). "
-        "Run: pip install -U tacotoolbox"
-    )
+
+
+def _check_version(module, minimum: str) -> None:
+    """Raise ImportError if an installed package is older than minimum (PEP 440 comparison)."""
+    if Version(module.__version__) < Version(minimum):
+        raise ImportError(
+            f"{module.__name__} >= {minimum} required (found {module.__version__}). "
+            f"Run: pip install -U {module.__name__}"
+        )
+
+
+# Checked once, when the dataset package first imports its config
+_check_version(tacotoolbox, "0.22.0")
 
 from tacotoolbox.datamodel.taco import Provider, Curator, Publication, Publications
 
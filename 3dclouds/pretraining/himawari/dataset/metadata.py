@@ -28,7 +28,46 @@ Usage:
     contexts = load_contexts(limit=10)
 """
 
+import heapq
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
+
+
+def _path_key(path: str) -> list[str]:
+    """Sort key ordering paths component by component (same order as sorted(Path))."""
+    return path.split(os.sep)
+
+
+def _iter_tifs(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield entries of all *.tif files under root, in _path_key order of their paths.
+
+    Uses os.scandir so file/dir type comes from the directory entry itself
+    (no stat per file). Each directory is sorted locally as it is reached,
+    so the walk is lazy: callers can stop early without scanning the rest.
+    Symlinked directories are not followed, as with rglob.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_tifs(entry.path)
+        elif entry.name.endswith(".tif"):
+            yield entry
+
+
+def _scan_concurrently(roots: list[str]) -> list[list[os.DirEntry]]:
+    """
+    Fully walk each root with _iter_tifs on its own thread.
+
+    os.scandir releases the GIL while blocked in the filesystem, so walks
+    of separate trees overlap. Results keep the order of roots.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(roots))) as executor:
+        return list(executor.map(lambda root: list(_iter_tifs(root)), roots))
 
 
 def load_contexts(limit: float | int | None = None) -> list[dict]:
@@ -60,38 +99,46 @@ def load_contexts(limit: float | int | None = None) -> list[dict]:
     himawari_path = root / "himawari"
     cyclones_path = root / "cyclones" / "himawari"
     
-    tif_files = []
+    trees = [
+        (str(p), is_cyclone)
+        for p, is_cyclone in ((himawari_path, False), (cyclones_path, True))
+        if p.exists()
+    ]
+    roots = [tree for tree, _ in trees]
     
-    # Add regular HIMAWARI files
-    if himawari_path.exists():
-        tif_files.extend(list(himawari_path.rglob("*.tif")))
+    # Both trees are walked in sorted order and merged. An int limit walks
+    # them lazily so it can stop early; otherwise both are scanned in parallel
+    if isinstance(limit, int):
+        scans = [_iter_tifs(r) for r in roots]
+    else:
+        scans = _scan_concurrently(roots)
     
-    # Add cyclone HIMAWARI files
-    if cyclones_path.exists():
-        tif_files.extend(list(cyclones_path.rglob("*.tif")))
+    # Each entry is tagged with the tree it came from (no per-path substring test)
+    sources = [
+        zip(scan, itertools.repeat(is_cyclone))
+        for scan, (_, is_cyclone) in zip(scans, trees)
+    ]
+    tif_files = heapq.merge(*sources, key=lambda item: _path_key(item[0].path))
     
-    # Sort for consistent ordering
-    tif_files = sorted(tif_files)
+    # Apply limit: an int stops the walk after `limit` files; a fraction
+    # needs the total, so everything is scanned first
+    if isinstance(limit, float):
+        tif_files = list(tif_files)
+        count = int(len(tif_files) * limit) or 1
+        tif_files = tif_files[:count]
+    elif limit is not None:
+        tif_files = itertools.islice(tif_files, limit)
     
-    # Build contexts
+    # Build contexts (Path objects only created here; id is the name minus ".tif")
     contexts = []
-    for tif_file in tif_files:
+    for entry, is_cyclone in tif_files:
         contexts.append({
-            "id": tif_file.stem,
-            "path": tif_file,
-            "is_cyclone": "/cyclones/" in str(tif_file),
+            "id": entry.name[:-4],
+            "path": Path(entry.path),
+            "is_cyclone": is_cyclone,
         })
     
-    # Apply limit
-    if limit is None:
-        return contexts
-    elif isinstance(limit, float):
-        # Percentage (0.0-1.0)
-        count = int(len(contexts) * limit) or 1
-        return contexts[:count]
-    else:
-        # Exact count
-        return contexts[:limit]
+    return contexts
 
 
 if __name__ == "__main__":
@@ -62,4 +62,38 @@ class Cyclone(SampleExtension):
         """Compute the metadata for this sample."""
         return pa.Table.from_pydict({
             "cloud3d:cyclone": [self.is_cyclone],
-        }, schema=self.get_schema())
\ No newline at end of file
+        }, schema=self.get_schema())
+
+
+class Centroid(SampleExtension):
+    """
+    Sample centroid as two float32 columns (EPSG:4326).
+    
+    Columnar companion to the stac:centroid WKB point, for numeric scans
+    and grid bucketing without parsing geometry. float32 keeps ~1 m
+    precision at these scales.
+    """
+    
+    lon: float
+    lat: float
+    
+    def get_schema(self) -> pa.Schema:
+        """Return the schema for this extension."""
+        return pa.schema([
+            pa.field("cloud3d:centroid_lon", pa.float32()),
+            pa.field("cloud3d:centroid_lat", pa.float32()),
+        ])
+    
+    def get_field_descriptions(self) -> dict[str, str]:
+        """Return field descriptions for documentation."""
+        return {
+            "cloud3d:centroid_lon": "Centroid longitude in degrees (EPSG:4326, float32)",
+            "cloud3d:centroid_lat": "Centroid latitude in degrees (EPSG:4326, float32)",
+        }
+    
+    def _compute(self, sample) -> pa.Table:
+        """Compute the metadata for this sample."""
+        return pa.Table.from_pydict({
+            "cloud3d:centroid_lon": [self.lon],
+            "cloud3d:centroid_lat": [self.lat],
+        }, schema=self.get_schema())
@@ -22,7 +22,11 @@ Note:
     Parallel processing is controlled by config.py (LEVEL0_PARALLEL, WORKERS).
 """
 
-import numpy as np
+import functools
+import math
+import os
+from datetime import datetime
+
 import shapely
 import pyproj
 import rasterio as rio
@@ -36,13 +40,43 @@ from tacotoolbox.validator.sample import TacoTIFF
 
 from dataset.metadata import load_contexts
 from dataset.config import LEVEL0_SAMPLE_LIMIT, LEVEL0_PARALLEL, WORKERS
-from dataset.extensions import Satellite
+from dataset.extensions import Centroid, Satellite
 
 
 # Tortilla parameters
 PAD_TO = None
 STRICT_SCHEMA = True
 
+# GDAL options for header/metadata reads: no directory listing or .aux.xml
+# (PAM) lookups on each open
+GDAL_ENV = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_PAM_ENABLED": "NO",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(crs_wkt: str) -> pyproj.Transformer:
+    """Transformer from a source CRS to EPSG:4326, built once per CRS (per process)."""
+    return pyproj.Transformer.from_crs(crs_wkt, "EPSG:4326", always_xy=True)
+
+
+def _parse_acquisition_time(value: str) -> datetime:
+    """
+    Parse an ISO 8601 acquisition_time tag.
+
+    Uses the C-implemented datetime.fromisoformat and falls back to
+    dateutil's isoparse for layouts it does not accept.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return isoparse(value)
+
+
+# Every MSG sample carries the same satellite metadata: validate it once
+_SATELLITE_MSG = Satellite(satellite="MSG")
+
 
 # Sample builders - one function per file type
 def build_sample_msg(ctx: dict) -> Sample:
@@ -53,42 +87,44 @@ def build_sample_msg(ctx: dict) -> Sample:
     - STAC metadata with EPSG:4326 centroid
     - TacoTIFF Header
     - GeotiffStats
-    - cloud3d custom metadata (satellite only, no cyclones)
+    - cloud3d custom metadata (satellite and float32 centroid, no cyclones)
     """
     sample = Sample(id=ctx["id"], path=ctx["path"], type="FILE")
     
     # Validate as TacoTIFF
     sample.validate_with(TacoTIFF())
     
-    # Add TacoTIFF Header
-    sample.extend_with(Header())
-    
-    # Read GeoTIFF metadata
-    with rio.open(ctx["path"]) as src:
+    # Read GeoTIFF metadata (known GTiff: no driver probing, no shared dataset cache)
+    with rio.open(ctx["path"], driver="GTiff", sharing=False) as src:
         meta = src.meta
         tags = src.tags()
-        bounds = src.bounds
         
-        # Calculate centroid in EPSG:4326
-        transformer = pyproj.Transformer.from_crs(
-            src.crs,
-            "EPSG:4326",
-            always_xy=True
-        )
+        # Calculate centroid in EPSG:4326 (MSG files share one CRS, so the
+        # transformer comes from the cache after the first sample)
+        transformer = _get_transformer(src.crs.to_wkt())
         
-        # Reproject corners
-        lon_min, lat_min = transformer.transform(bounds.left, bounds.bottom)
-        lon_max, lat_max = transformer.transform(bounds.right, bounds.top)
+        # Reproject both bounds corners and the image center in one call;
+        # the center (in the source CRS) becomes the centroid
+        bounds = src.bounds
+        cx, cy = src.transform * (src.width / 2.0, src.height / 2.0)
+        lons, lats = transformer.transform(
+            [bounds.left, bounds.right, cx],
+            [bounds.bottom, bounds.top, cy],
+        )
+        centroid_lon, centroid_lat = lons[2], lats[2]
         
-        centroid_lon = (lon_min + lon_max) / 2
-        centroid_lat = (lat_min + lat_max) / 2
+        # Tiles whose corners fall off the Earth disk reproject to inf and
+        # are rejected, as is a non-finite center; checked before any WKB is built
+        if not all(math.isfinite(v) for v in (*lons, *lats)):
+            raise ValueError("Infinite bounds")
         centroid_wkb = shapely.to_wkb(shapely.Point(centroid_lon, centroid_lat))
     
     # Extract timestamp from tags (MSG uses acquisition_time)
     # Convert to microseconds (STAC expects microseconds)
-    acquisition_time_us = int(isoparse(tags["acquisition_time"]).timestamp() * 1_000_000)
+    acquisition_time = _parse_acquisition_time(tags["acquisition_time"])
+    acquisition_time_us = int(acquisition_time.timestamp() * 1_000_000)
     
-    # Add STAC metadata with corrected centroid
+    # STAC metadata with corrected centroid
     stac = STAC(
         crs=meta["crs"].to_string(),
         tensor_shape=(meta["count"], meta["height"], meta["width"]),
@@ -97,13 +133,19 @@ def build_sample_msg(ctx: dict) -> Sample:
         time_end=acquisition_time_us,
         centroid=centroid_wkb
     )
+    
+    # Add TacoTIFF Header (only once the geometry check has passed)
+    sample.extend_with(Header())
+    
+    # Add STAC metadata
     sample.extend_with(stac)
     
     # Add GeotiffStats
     sample.extend_with(GeotiffStats())
     
     # Add cloud3d custom metadata
-    sample.extend_with(Satellite(satellite="MSG"))
+    sample.extend_with(_SATELLITE_MSG)
+    sample.extend_with(Centroid(lon=centroid_lon, lat=centroid_lat))
     
     return sample
 
@@ -113,6 +155,16 @@ SAMPLES = [
 ]
 
 
+def _worker_init() -> None:
+    """
+    Pool initializer: apply GDAL_ENV through the environment, read by GDAL on
+    every open, and keep GDAL single-threaded (the pool already runs one worker
+    per core).
+    """
+    os.environ.update({key: str(value) for key, value in GDAL_ENV.items()})
+    os.environ["GDAL_NUM_THREADS"] = "1"
+
+
 # Helper for parallel processing - must be at module level for pickling
 def _build_samples_parallel(ctx: dict) -> tuple[list[Sample] | None, tuple[str, str] | None]:
     """
@@ -123,16 +175,9 @@ def _build_samples_parallel(ctx: dict) -> tuple[list[Sample] | None, tuple[str,
         (None, (id, error)) on failure
     """
     try:
+        # Builders raise on invalid geometry (see build_sample_msg)
         samples = [fn(ctx) for fn in SAMPLES]
         
-        # Validate geometry (no infinites, valid shapes)
-        for sample in samples:
-            geom = shapely.from_wkb(sample.model_dump()["stac:centroid"])
-            if not shapely.is_valid(geom):
-                return None, (ctx["id"], "Invalid geometry")
-            if np.isinf(geom.bounds).any():
-                return None, (ctx["id"], "Infinite bounds")
-        
         return samples, None
     except Exception as e:
         return None, (ctx["id"], str(e))
@@ -161,27 +206,33 @@ def build(contexts: list[dict] | None = None, parallel: bool | None = None, work
     
     # Generate samples in parallel or serial
     if parallel:
-        from concurrent.futures import ProcessPoolExecutor
-        
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            results = list(executor.map(_build_samples_parallel, contexts))
+        from multiprocessing import Pool
         
+        # Results streamed in completion order, ~8 chunks per worker to amortize IPC
+        chunksize = max(1, len(contexts) // (workers * 8))
         samples = []
-        for result, error in results:
-            if error:
-                failed_ids.append(error[0])
-                print(f"Failed to build sample {error[0]}: {error[1]}")
-            else:
-                samples.extend(result)
+        with Pool(workers, initializer=_worker_init) as pool:
+            for result, error in pool.imap_unordered(_build_samples_parallel, contexts, chunksize=chunksize):
+                if error:
+                    failed_ids.append(error[0])
+                    print(f"Failed to build sample {error[0]}: {error[1]}")
+                else:
+                    samples.extend(result)
+        
+        # Restore context order
+        order = {ctx["id"]: i for i, ctx in enumerate(contexts)}
+        samples.sort(key=lambda s: order[s.id])
     else:
         samples = []
-        for ctx in contexts:
-            result, error = _build_samples_parallel(ctx)
-            if error:
-                failed_ids.append(error[0])
-                print(f"Failed to build sample {error[0]}: {error[1]}")
-            else:
-                samples.extend(result)
+        # One GDAL environment for the whole serial loop (workers get it from _worker_init)
+        with rio.Env(**GDAL_ENV):
+            for ctx in contexts:
+                result, error = _build_samples_parallel(ctx)
+                if error:
+                    failed_ids.append(error[0])
+                    print(f"Failed to build sample {error[0]}: {error[1]}")
+                else:
+                    samples.extend(result)
     
     if failed_ids:
         print(f"\nTotal failed samples: {len(failed_ids)}")
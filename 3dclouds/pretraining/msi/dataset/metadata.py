@@ -25,19 +25,51 @@ Usage:
     contexts = load_contexts(limit=10)
 """
 
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
-import tacoreader
-if tacoreader.__version__ < "2.0.0":
-    raise ImportError(
-        f"tacoreader >= 2.0.0 required (found {tacoreader.__version__}). "
-        "Run: pip install -U tacoreader"
-    )
+from dataset.config import WORKERS
 
-from dataset.config import DATAFRAME_BACKEND
 
-# Configure DataFrame backend globally
-tacoreader.use(DATAFRAME_BACKEND)
+def _iter_tifs(root: str) -> Iterator[str]:
+    """
+    Yield paths of all *.tif files under root, in sorted (component-wise) order.
+
+    Uses os.scandir so file/dir type comes from the directory entry itself
+    (no stat per file). Each directory is sorted locally as it is reached,
+    so the walk is lazy: callers can stop early without scanning the rest.
+    Symlinked directories are not followed, as with rglob.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_tifs(entry.path)
+        elif entry.name.endswith(".tif"):
+            yield entry.path
+
+
+def _scan_top_level(root: str) -> list[str]:
+    """
+    Same result as list(_iter_tifs(root)), with each top-level subdirectory
+    walked on its own thread.
+
+    os.scandir releases the GIL while blocked in the filesystem, so walks
+    of sibling subtrees overlap. Subtrees are concatenated in name order.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    
+    def scan(entry: os.DirEntry) -> list[str]:
+        if entry.is_dir(follow_symlinks=False):
+            return list(_iter_tifs(entry.path))
+        return [entry.path] if entry.name.endswith(".tif") else []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(WORKERS, len(entries)))) as executor:
+        return [path for paths in executor.map(scan, entries) for path in paths]
 
 
 def load_contexts(limit: float | int | None = None) -> list[dict]:
@@ -64,26 +96,33 @@ def load_contexts(limit: float | int | None = None) -> list[dict]:
     root = Path("/data/databases/CLOUD_3D/pretraining/geotiff/")
     msg_path = root / "msg"
     
-    tif_files = []
-    if msg_path.exists():
-        tif_files.extend(list(msg_path.rglob("*.tif")))
+    # An int limit walks the tree lazily so it can stop early; otherwise the
+    # top-level subdirectories (high fan-out) are scanned in parallel
+    if not msg_path.exists():
+        tif_files = iter(())
+    elif isinstance(limit, int):
+        tif_files = _iter_tifs(str(msg_path))
+    else:
+        tif_files = _scan_top_level(str(msg_path))
     
-    tif_files = sorted(tif_files)
+    # Apply limit: an int stops the walk after `limit` files; a fraction
+    # needs the total, so everything is scanned first
+    if isinstance(limit, float):
+        tif_files = list(tif_files)
+        count = int(len(tif_files) * limit) or 1
+        tif_files = tif_files[:count]
+    elif limit is not None:
+        tif_files = itertools.islice(tif_files, limit)
     
     contexts = []
     for tif_file in tif_files:
+        path = Path(tif_file)
         contexts.append({
-            "id": tif_file.stem,
-            "path": tif_file,
+            "id": path.stem,
+            "path": path,
         })
     
-    if limit is None:
-        return contexts
-    elif isinstance(limit, float):
-        count = int(len(contexts) * limit) or 1
-        return contexts[:count]
-    else:
-        return contexts[:limit]
+    return contexts
 
 
 if __name__ == "__main__":